@@ -1,4 +1,3 @@
-from functools import lru_cache
 from pathlib import Path
 from typing import Self
 
@@ -15,6 +14,14 @@ class DatabaseSettings(BaseSettings):
     DB: str
     PORT: int = 5432
     DSN: PostgresDsn | None = None
+    # Connections kept open in the engine pool, and extra connections allowed under load
+    POOL_SIZE: int = 20
+    MAX_OVERFLOW: int = 10
+    # Seconds after which a pooled connection is replaced instead of pinged on every checkout
+    POOL_RECYCLE: int = 1800
+    POOL_PRE_PING: bool = False
+    # Prepared statements cached per connection by the asyncpg dialect
+    PREPARED_STATEMENT_CACHE_SIZE: int = 500
 
     @model_validator(mode="after")
     def assemble_db_connection(self) -> Self:
@@ -39,6 +46,12 @@ class RedisSettings(BaseSettings):
     PORT: int
     DB: int
     DSN: RedisDsn | None = None
+    # Maximum number of connections in the shared connection pool
+    MAX_CONNECTIONS: int = 64
+    # Seconds to wait for a free pool connection before failing, once all MAX_CONNECTIONS are in use
+    POOL_TIMEOUT: float = 5.0
+    # Connections opened at startup, so early requests skip the TCP (and AUTH) handshake
+    WARM_CONNECTIONS: int = 4
 
     @model_validator(mode="after")
     def assemble_redis_connection(self) -> Self:
@@ -99,12 +112,11 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache
+settings = Settings()
+
+
 def get_settings() -> Settings:
     """
-    Retrieves and caches the application settings.
+    Retrieves the application settings, loaded once at import.
     """
-    return Settings()
-
-
-settings = get_settings()
+    return settings
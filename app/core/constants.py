@@ -1,11 +1,17 @@
 from enum import Enum
+from functools import cache
 from typing import Any
 
 
 class BaseEnum(str, Enum):
     @classmethod
-    def list(cls) -> list[Any]:
-        return list(map(lambda item: item.value, cls))
+    @cache
+    def list(cls) -> tuple[Any, ...]:
+        """
+        Values of all members, computed once per enum class.
+        Returned as a tuple so the cached result cannot be mutated by callers.
+        """
+        return tuple(item.value for item in cls)
 
 
 class Environment(BaseEnum):
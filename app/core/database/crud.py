@@ -1,10 +1,12 @@
 from collections.abc import Sequence
+from functools import cached_property, lru_cache
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Select, UnaryExpression, desc, insert, inspect, select
 from sqlalchemy import delete as sql_delete
-from sqlalchemy import desc, select
+from sqlalchemy import update as sql_update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 
@@ -15,6 +17,14 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+@lru_cache
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter[list[BaseModel]]:
+    """
+    Build (once per schema) an adapter that dumps a whole list of schema instances in a single call.
+    """
+    return TypeAdapter(list[schema])
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
     Base class for CRUD operations: create, read, update, delete.
@@ -30,6 +40,32 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
+    @cached_property
+    def _has_orm_delete_cascade(self) -> bool:
+        """
+        Whether deleting a record needs the ORM to cascade the delete to related records,
+        i.e. the database does not handle it with ON DELETE.
+        Resolved on first use, once all mappers are configured.
+        """
+        return any(
+            relationship.cascade.delete and not relationship.passive_deletes
+            for relationship in inspect(self.model).relationships
+        )
+
+    @cached_property
+    def _default_order(self) -> tuple[UnaryExpression, ...]:
+        """
+        Default ordering for filter: newest first by created_at.
+        """
+        return (desc(self.model.created_at),)
+
+    @cached_property
+    def _select(self) -> Select[tuple[ModelType]]:
+        """
+        Base SELECT for the model. Statements are immutable, so it is safely extended per query.
+        """
+        return select(self.model)
+
     async def get(self, db: AsyncSession, id: UUID) -> ModelType | None:
         """
         Get a specific record by id.
@@ -63,9 +99,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             Sequence[ModelType]: List of instances of the ModelType
         """
         if order_on is None:
-            # Default ordering by created_at
-            order_on = [desc(self.model.created_at)]
-        query = select(self.model)
+            order_on = self._default_order
+        query = self._select
         if filters:
             query = query.where(*filters)
         query = query.order_by(*order_on).offset(offset).limit(limit)
@@ -83,8 +118,9 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         db_obj = self.model(**obj_in.model_dump(mode="json"))
         db.add(db_obj)
+        # Server defaults are returned by the INSERT itself (eager_defaults) and the session
+        # does not expire on commit, so the instance is complete without a refresh
         await db.commit()
-        await db.refresh(instance=db_obj)
         return db_obj
 
     async def bulk_create(self, db: AsyncSession, *, objs_in: list[CreateSchemaType]) -> list[ModelType]:
@@ -96,31 +132,46 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             List of instances of the ModelType for the created records
         """
-        db_objs = [self.model(**obj_in.model_dump()) for obj_in in objs_in]
-        db.add_all(db_objs)
+        # An executemany with no parameter sets would insert a single row of defaults
+        if not objs_in:
+            return []
+
+        # One INSERT ... RETURNING batched over all rows, instead of flushing an ORM instance per row
+        statement = insert(self.model).returning(self.model)
+        rows = _list_adapter(type(objs_in[0])).dump_python(objs_in, mode="json")
+        result = await db.scalars(statement, rows)
+        db_objs = list(result.all())
         await db.commit()
         return db_objs
 
-    async def update(self, db: AsyncSession, *, id: Any, obj_in: UpdateSchemaType) -> ModelType | None:
+    async def update(
+        self, db: AsyncSession, *, id: Any, obj_in: UpdateSchemaType, returning: bool = True
+    ) -> ModelType | None:
         """
         Update a specific record by id.
         Args:
             db (AsyncSession): Database session
             id (Any): Id of the record to update
             obj_in (UpdateSchemaType): Pydantic schema model with the data to update
+            returning (bool, optional): Whether to fetch and return the updated record. Defaults to True.
         Returns:
-            ModelType | None: Instance of the ModelType for the updated record if found, else None
+            ModelType | None: Instance of the ModelType for the updated record if found and returning is set,
+            else None
         """
-        db_obj = await db.get(self.model, id)
-        if not db_obj:
-            return None
-
         obj_in_data = obj_in.model_dump(mode="json", exclude_unset=True)
-        for field, value in obj_in_data.items():
-            setattr(db_obj, field, value)
+        if not obj_in_data:
+            return await db.get(self.model, id) if returning else None
+
+        statement = sql_update(self.model).where(self.model.id == id).values(**obj_in_data)
+        if not returning:
+            # Skip building and hydrating a result row, and the identity map sync pass
+            await db.execute(statement.execution_options(synchronize_session=False))
+            await db.commit()
+            return None
 
+        # Update and fetch the record in a single round trip instead of get + commit + refresh
+        db_obj = await db.scalar(statement.returning(self.model))
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
 
     async def delete(self, db: AsyncSession, *, id: UUID) -> None:
@@ -129,11 +180,13 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Args:
             db (AsyncSession): Database session
             id (int): Id of the record to delete
-        Returns:
-            Instance of the ModelType for the deleted record if found, else None
         """
-        db_obj = await db.get(self.model, id)
-        await db.delete(db_obj)
+        if self._has_orm_delete_cascade:
+            db_obj = await db.get(self.model, id)
+            await db.delete(db_obj)
+        else:
+            # Related rows are removed by the database, so a single DELETE is enough
+            await db.execute(sql_delete(self.model).where(self.model.id == id))
         await db.commit()
 
     async def bulk_delete(self, db: AsyncSession, *, ids: list[UUID]) -> None:
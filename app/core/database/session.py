@@ -3,6 +3,14 @@ from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from app.core.config import settings
 
 # an Engine, which the Session will use for connection resources
-async_engine = create_async_engine(url=str(settings.DATABASE.DSN), pool_pre_ping=True, echo=False)
+async_engine = create_async_engine(
+    url=str(settings.DATABASE.DSN),
+    pool_size=settings.DATABASE.POOL_SIZE,
+    max_overflow=settings.DATABASE.MAX_OVERFLOW,
+    pool_recycle=settings.DATABASE.POOL_RECYCLE,
+    pool_pre_ping=settings.DATABASE.POOL_PRE_PING,
+    connect_args={"prepared_statement_cache_size": settings.DATABASE.PREPARED_STATEMENT_CACHE_SIZE},
+    echo=False,
+)
 
 AsyncSessionLocal = async_sessionmaker(bind=async_engine, autocommit=False, autoflush=False, expire_on_commit=False)
@@ -1,18 +1,36 @@
+import asyncio
 import io
 
 from fastapi import HTTPException, UploadFile
-from PIL import Image, ImageOps
+from PIL import ExifTags, Image, ImageOps
 
 from app.core.image.constants import ImageLimits
 
+# EXIF orientations that rotate the image by 90 degrees, swapping width and height
+TRANSPOSED_ORIENTATIONS = frozenset({5, 6, 7, 8})
+
+# Maximum number of extra encodes when searching for a higher quality that still fits the file size limit
+QUALITY_SEARCH_STEPS = 2
+# Fraction of the file size limit at which a fitting encode is good enough to stop searching
+QUALITY_SEARCH_TARGET_RATIO = 0.9
+
 
 class ImageProcessor:
     @staticmethod
-    def check_needs_processing(image: Image.Image, file_size: int, limits: ImageLimits) -> bool:
+    def get_oriented_size(image: Image.Image) -> tuple[int, int]:
         """
-        Return True if the image dimensions exceed the allowed limits or if the file size is too high.
+        Return the image dimensions after EXIF orientation is applied, without decoding the pixel data.
         """
         width, height = image.size
+        if image.getexif().get(ExifTags.Base.Orientation, 1) in TRANSPOSED_ORIENTATIONS:
+            return height, width
+        return width, height
+
+    @staticmethod
+    def check_needs_processing(width: int, height: int, file_size: int, limits: ImageLimits) -> bool:
+        """
+        Return True if the image dimensions exceed the allowed limits or if the file size is too high.
+        """
         return width > limits.max_width or height > limits.max_height or file_size > limits.max_file_size
 
     @staticmethod
@@ -25,63 +43,107 @@ class ImageProcessor:
         image.save(output, format=fmt, quality=quality, optimize=True, progressive=True)
         return output.getvalue()
 
+    @staticmethod
+    def _save_within_size(image: Image.Image, limits: ImageLimits) -> bytes:
+        """
+        Save the image at the primary quality if it fits the file size limit, otherwise at the highest
+        quality found between the fallback and primary quality that fits.
+        The fallback quality is tried right after the primary one, so an image that cannot fit is rejected
+        after two encodes. The search only runs once a fitting encode is in hand, and returns it without
+        re-encoding.
+        """
+        processed_bytes = ImageProcessor._save_image(image, limits.format, limits.quality)
+        if len(processed_bytes) <= limits.max_file_size:
+            return processed_bytes
+
+        processed_bytes = ImageProcessor._save_image(image, limits.format, limits.fallback_quality)
+        if len(processed_bytes) > limits.max_file_size:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"Unable to compress image to acceptable size. "
+                    f"Final size: {len(processed_bytes) / (1024 * 1024):.1f}MB, "
+                    f"Limit: {limits.max_file_size / (1024 * 1024):.1f}MB"
+                ),
+            )
+
+        best = processed_bytes
+        low, high = limits.fallback_quality + 1, limits.quality - 1
+        for _ in range(QUALITY_SEARCH_STEPS):
+            # Stop once the encode is close to the limit, as a higher quality would barely change it
+            if low > high or len(best) >= limits.max_file_size * QUALITY_SEARCH_TARGET_RATIO:
+                break
+            mid = (low + high) // 2
+            candidate = ImageProcessor._save_image(image, limits.format, mid)
+            if len(candidate) <= limits.max_file_size:
+                best = candidate
+                low = mid + 1
+            else:
+                high = mid - 1
+        return best
+
     @staticmethod
     async def process_image(file: UploadFile, limits: ImageLimits) -> UploadFile:
         """
         Process an uploaded image according to the provided limits.
+        Decoding, resizing and encoding are CPU bound, so they run in a worker thread
+        (Pillow releases the GIL in its C code) instead of blocking the event loop.
+        """
+        return await asyncio.to_thread(ImageProcessor._process_image, file, limits)
+
+    @staticmethod
+    def _process_image(file: UploadFile, limits: ImageLimits) -> UploadFile:
+        """
+        Synchronously process an uploaded image according to the provided limits.
 
         Steps:
-          1. Read the file into memory.
-          2. Open the image and auto-orient it using EXIF data.
-          3. If the image already meets the limits, wrap and return its raw bytes as an UploadFile.
-          4. Otherwise, convert to RGB (if needed) and resize using the LANCZOS filter while preserving aspect ratio.
+          1. Open the image straight from the uploaded file and read its EXIF oriented size from the header.
+          2. If the image already meets the limits, return the original upload rewound to the start.
+          3. Otherwise, let JPEG images decode at a reduced scale close to the target size (DCT domain).
+          4. Auto-orient using EXIF data, convert to RGB (if needed) and resize using the LANCZOS filter
+             while preserving aspect ratio.
           5. Save the image using the primary quality setting.
-          6. If the result still exceeds the file size limit, try the fallback quality.
-          7. Return a new UploadFile instance containing the (possibly processed) image bytes.
+          6. If the result still exceeds the file size limit, binary search down to the fallback quality
+             for the highest quality that fits.
+          7. Return a new UploadFile instance containing the processed image bytes.
         """
         try:
-            content = await file.read()
-            file_size = len(content)
-
-            # Open the image from memory and auto-correct orientation.
-            with Image.open(io.BytesIO(content)) as image:
-                image = ImageOps.exif_transpose(image)
-                orig_width, orig_height = image.size
-                orig_mode = image.mode
-
-                # If image already meets limits, return a new UploadFile wrapping original bytes.
-                if not ImageProcessor.check_needs_processing(image, file_size, limits):
-                    return UploadFile(
-                        file=io.BytesIO(content),
-                        filename=file.filename,
-                        size=file_size,
-                    )
+            # Decode from the spooled upload instead of copying all of it into memory first.
+            file_size = file.size
+            if file_size is None:
+                file_size = file.file.seek(0, io.SEEK_END)
+            file.file.seek(0)
+
+            with Image.open(file.file) as image:
+                width, height = ImageProcessor.get_oriented_size(image)
+
+                # If image already meets limits, return the original upload without decoding it.
+                if not ImageProcessor.check_needs_processing(width, height, file_size, limits):
+                    file.file.seek(0)
+                    return file
+
+                new_size = None
+                if width > limits.max_width or height > limits.max_height:
+                    ratio = min(limits.max_width / width, limits.max_height / height)
+                    new_size = (int(width * ratio), int(height * ratio))
+                    # JPEG only: decode at 1/2, 1/4 or 1/8 scale, never below the target size,
+                    # so fewer pixels are decoded before the LANCZOS pass.
+                    raw_width, raw_height = image.size
+                    image.draft(None, (max(1, int(raw_width * ratio)), max(1, int(raw_height * ratio))))
+
+                # Auto-correct orientation (this decodes the pixel data).
+                ImageOps.exif_transpose(image, in_place=True)
 
                 # Convert to RGB if needed.
-                if orig_mode in ("RGBA", "P"):
+                if image.mode in ("RGBA", "P"):
                     image = image.convert("RGB")
 
                 # Resize if dimensions exceed limits.
-                if orig_width > limits.max_width or orig_height > limits.max_height:
-                    ratio = min(limits.max_width / orig_width, limits.max_height / orig_height)
-                    new_size = (int(orig_width * ratio), int(orig_height * ratio))
+                if new_size:
                     image = image.resize(new_size, Image.Resampling.LANCZOS)
 
-                # Save with primary quality.
-                processed_bytes = ImageProcessor._save_image(image, limits.format, limits.quality)
-
-                # If still too large, try fallback quality.
-                if len(processed_bytes) > limits.max_file_size:
-                    processed_bytes = ImageProcessor._save_image(image, limits.format, limits.fallback_quality)
-                    if len(processed_bytes) > limits.max_file_size:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=(
-                                f"Unable to compress image to acceptable size. "
-                                f"Final size: {len(processed_bytes) / (1024 * 1024):.1f}MB, "
-                                f"Limit: {limits.max_file_size / (1024 * 1024):.1f}MB"
-                            ),
-                        )
+                # Save with the highest quality that fits the file size limit.
+                processed_bytes = ImageProcessor._save_within_size(image, limits)
 
                 return UploadFile(
                     file=io.BytesIO(processed_bytes),
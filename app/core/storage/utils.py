@@ -1,14 +1,17 @@
 import unicodedata
+from functools import lru_cache
 
 from app.core.config import settings
 from app.core.constants import StorageProvider
 from app.core.storage.interface import StorageBackend
-from app.core.storage.local import LocalStorage
+from app.core.storage.local import ATTACHMENTS_URL, LocalStorage
 
 
+@lru_cache
 def get_storage() -> StorageBackend:
     """
     Get the storage backend based on the configured provider.
+    The backend is stateless, so a single instance is created and shared across requests.
     """
     if settings.STORAGE_PROVIDER == StorageProvider.LOCAL:
         return LocalStorage(base_path=settings.FILE_STORAGE_PATH)
@@ -27,6 +30,9 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         str: The sanitized filename
     """
+    # ASCII names are unchanged by NFKD and the ASCII encode, so skip both
+    if filename.isascii():
+        return filename
     # Normalize and remove non-ASCII characters
     return unicodedata.normalize("NFKD", filename).encode("ascii", "ignore").decode("ascii")
 
@@ -39,6 +45,9 @@ def normalize_filename(filename: str) -> str:
     Returns:
         str: The normalized filename
     """
+    # ASCII text is already in NFC form
+    if filename.isascii():
+        return filename
     return unicodedata.normalize("NFC", filename)
 
 
@@ -51,7 +60,7 @@ def get_attachment_download_url(storage_path: str) -> str:
         # "/uploads/8a540b73-.../ba194f98-da60-44a9-.../filename"
         # The endpoint URL becomes:
         # {BASE_URL}{API_URL}/v1/attachments/<folder>/<filename>
-        return f"{str(settings.BASE_URL).rstrip('/')}{settings.API_URL}/v1/attachments{storage_path}/"
+        return f"{ATTACHMENTS_URL}{storage_path}/"
     elif settings.STORAGE_PROVIDER == StorageProvider.S3:
         raise NotImplementedError("S3 URL generation not yet implemented")
     else:
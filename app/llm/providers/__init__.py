@@ -1,13 +1,38 @@
 """Provider builders for pydantic-ai integration."""
 
-from app.llm.providers.anthropic import AnthropicProviderBuilder
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from app.llm.providers.base import ProviderBuilder
-from app.llm.providers.bedrock import BedrockProviderBuilder
-from app.llm.providers.cohere import CohereProviderBuilder
-from app.llm.providers.gemini import GeminiProviderBuilder
-from app.llm.providers.groq import GroqProviderBuilder
-from app.llm.providers.mistral import MistralProviderBuilder
-from app.llm.providers.openai import OpenAIProviderBuilder
+
+if TYPE_CHECKING:
+    from app.llm.providers.anthropic import AnthropicProviderBuilder
+    from app.llm.providers.bedrock import BedrockProviderBuilder
+    from app.llm.providers.cohere import CohereProviderBuilder
+    from app.llm.providers.gemini import GeminiProviderBuilder
+    from app.llm.providers.groq import GroqProviderBuilder
+    from app.llm.providers.mistral import MistralProviderBuilder
+    from app.llm.providers.openai import OpenAIProviderBuilder
+
+# Each builder imports its provider SDK, so builders are imported on first access (PEP 562)
+_BUILDER_MODULES = {
+    "AnthropicProviderBuilder": "app.llm.providers.anthropic",
+    "BedrockProviderBuilder": "app.llm.providers.bedrock",
+    "CohereProviderBuilder": "app.llm.providers.cohere",
+    "GeminiProviderBuilder": "app.llm.providers.gemini",
+    "GroqProviderBuilder": "app.llm.providers.groq",
+    "MistralProviderBuilder": "app.llm.providers.mistral",
+    "OpenAIProviderBuilder": "app.llm.providers.openai",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _BUILDER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    builder = getattr(import_module(_BUILDER_MODULES[name]), name)
+    globals()[name] = builder
+    return builder
+
 
 __all__ = [
     "ProviderBuilder",
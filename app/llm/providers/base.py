@@ -57,5 +57,5 @@ class ProviderBuilder(ABC):
         if system_prompt:
             agent_kwargs["instructions"] = system_prompt
 
-        logger.info(f"Creating agent with kwargs: {agent_kwargs}")
+        logger.info(f"Creating agent for model {model.name} with {len(toolsets)} toolsets")
         return Agent(**agent_kwargs)
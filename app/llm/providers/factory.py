@@ -1,19 +1,11 @@
 """Pydantic AI provider factory and management."""
 
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic_ai import Agent
 
-from app.llm.providers import (
-    AnthropicProviderBuilder,
-    BedrockProviderBuilder,
-    CohereProviderBuilder,
-    GeminiProviderBuilder,
-    GroqProviderBuilder,
-    MistralProviderBuilder,
-    OpenAIProviderBuilder,
-    ProviderBuilder,
-)
+from app.llm import providers
+from app.llm.providers import ProviderBuilder
 from app.provider.constants import ProviderType
 from app.model.model import LLMModel
 from app.provider.model import LLMProvider
@@ -22,15 +14,18 @@ from app.provider.model import LLMProvider
 class ProviderFactory:
     """Factory for creating pydantic-ai models and agents with provider-specific configurations."""
 
-    # Registry of provider builders
-    _builders: dict[ProviderType, type[ProviderBuilder]] = {
-        ProviderType.OPENAI: OpenAIProviderBuilder,
-        ProviderType.ANTHROPIC: AnthropicProviderBuilder,
-        ProviderType.GEMINI: GeminiProviderBuilder,
-        ProviderType.GROQ: GroqProviderBuilder,
-        ProviderType.MISTRAL: MistralProviderBuilder,
-        ProviderType.COHERE: CohereProviderBuilder,
-        ProviderType.BEDROCK: BedrockProviderBuilder,
+    # Registry of provider builders, filled as builders are first requested or registered
+    _builders: dict[ProviderType, type[ProviderBuilder]] = {}
+
+    # Built-in builders by name; importing one loads its provider SDK, so it is deferred until first use
+    _builtin_builders: ClassVar[dict[ProviderType, str]] = {
+        ProviderType.OPENAI: "OpenAIProviderBuilder",
+        ProviderType.ANTHROPIC: "AnthropicProviderBuilder",
+        ProviderType.GEMINI: "GeminiProviderBuilder",
+        ProviderType.GROQ: "GroqProviderBuilder",
+        ProviderType.MISTRAL: "MistralProviderBuilder",
+        ProviderType.COHERE: "CohereProviderBuilder",
+        ProviderType.BEDROCK: "BedrockProviderBuilder",
     }
 
     @classmethod
@@ -45,7 +40,9 @@ class ProviderFactory:
             ValueError: If provider type is not supported
         """
         if provider_type not in cls._builders:
-            raise ValueError(f"Unsupported provider type: {provider_type}")
+            if provider_type not in cls._builtin_builders:
+                raise ValueError(f"Unsupported provider type: {provider_type}")
+            cls._builders[provider_type] = getattr(providers, cls._builtin_builders[provider_type])
 
         return cls._builders[provider_type]()
 
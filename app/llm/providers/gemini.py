@@ -1,5 +1,7 @@
 """Gemini provider builder."""
 
+from typing import ClassVar
+
 from pydantic_ai.models.google import GoogleModel
 
 from app.llm.providers.base import ProviderBuilder
@@ -10,6 +12,10 @@ from app.provider.model import LLMProvider
 class GeminiProviderBuilder(ProviderBuilder):
     """Builder for Google Gemini providers."""
 
+    # Models are configured from the environment only, so one instance per model name can be shared,
+    # along with the HTTP client its provider holds
+    _models: ClassVar[dict[str, GoogleModel]] = {}
+
     def build_model(self, provider: LLMProvider, model: LLMModel) -> GoogleModel:
         """
         Build Gemini model with custom provider configuration.
@@ -28,4 +34,7 @@ class GeminiProviderBuilder(ProviderBuilder):
         # For Gemini, we typically use the default provider
         # Custom configuration would need to be handled through environment variables
         # or custom client configuration
-        return GoogleModel(model_name=model.name)
+        google_model = self._models.get(model.name)
+        if google_model is None:
+            google_model = self._models[model.name] = GoogleModel(model_name=model.name)
+        return google_model
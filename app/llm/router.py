@@ -1,6 +1,5 @@
 """Chat router using pydantic_ai with message-based streaming."""
 
-from collections.abc import AsyncGenerator
 from typing import Annotated
 from uuid import UUID
 
@@ -51,7 +50,7 @@ async def stream_completion(
     ### Parameters
     - **session_id**: UUID of the chat session
     - **message_id**: UUID of the message to generate completion for
-    - **params**: Generation parameters (temperature, max_tokens)
+    - **params**: Generation parameters (temperature, max_tokens) and whether to stream thinking status blocks
 
     ### Returns
     Server-sent events stream of the generated completion
@@ -64,26 +63,25 @@ async def stream_completion(
     # Get session with provider and model information
     session = await session_service.get_active_session(session_id=session_id)
 
-    # Create the AI response generator
-    async def streaming_response() -> AsyncGenerator[str, None]:
-        """Generate AI responses."""
-        async for chunk in chat_service.stream_response(
-            provider=session.provider,
-            model=session.llm_model,
-            session_id=session_id,
-            message_id=message_id,
-            system_prompt=session.system_context,
-            temperature=params.temperature,
-            max_tokens=params.max_tokens,
-            top_p=params.top_p,
-        ):
-            yield chunk
+    # Create the AI response generator; passed straight through so each chunk
+    # is not re-yielded by an intermediate generator frame
+    streaming_response = chat_service.stream_response(
+        provider=session.provider,
+        model=session.llm_model,
+        session_id=session_id,
+        message_id=message_id,
+        system_prompt=session.system_context,
+        temperature=params.temperature,
+        max_tokens=params.max_tokens,
+        top_p=params.top_p,
+        include_thinking=params.include_thinking,
+    )
 
     # Use SSE manager to handle the streaming with Redis Pub/Sub
     return StreamingResponse(
         sse_manager.stream_generator(
             session_id=session_id,
-            generator=streaming_response(),
+            generator=streaming_response,
             background_tasks=background_tasks,
         ),
         media_type="text/event-stream",
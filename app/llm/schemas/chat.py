@@ -11,3 +11,5 @@ class CompletionParams(BaseModel):
     max_tokens: int = Field(default=llm_defaults.MAX_TOKENS, gt=0)
     temperature: float = Field(default=llm_defaults.TEMPERATURE, ge=0.0, le=2.0)
     top_p: float = Field(default=llm_defaults.TOP_P, ge=0.0, le=1.0)
+    # Thinking blocks are UI status messages only; clients that do not render them can opt out
+    include_thinking: bool = True
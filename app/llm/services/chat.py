@@ -1,12 +1,11 @@
 import asyncio
 import json
-import sys
+import time
 from pathlib import Path
-from collections.abc import AsyncIterator
-from typing import Any
+from collections.abc import AsyncIterator, Sequence
+from typing import ClassVar
 from uuid import UUID
 
-import aiofiles
 from llm_registry import CapabilityRegistry, ModelCapabilities
 from llm_registry.exceptions import ModelNotFoundError
 from loguru import logger
@@ -48,6 +47,7 @@ from app.llm.services.stream_block_factory import StreamBlockFactory
 from app.llm.services.tool_tracker import ToolCallTracker
 from app.mcp_server.lifecycle import mcp_lifecycle_manager
 from app.message.constants import MessageRole, MessageStatus
+from app.message.crud import crud_message
 from app.message.model import ChatMessage
 from app.message.schema import MessageCreate, MessageRead, MessageUpdate, MessageUsage
 from app.message.service import ChatMessageService
@@ -56,6 +56,13 @@ from app.provider.model import LLMProvider
 
 # Constants
 ONE_MILLION_TOKENS = 1_000_000
+# Seconds before the model capability registry is reloaded, picking up user model changes
+MODEL_REGISTRY_TTL = 600
+# Buffered text deltas are sent once they reach this many characters or have waited this many seconds
+TEXT_DELTA_FLUSH_SIZE = 64
+TEXT_DELTA_FLUSH_INTERVAL = 0.01
+# Seconds over which queued message status updates are coalesced into one database round trip
+STATUS_FLUSH_INTERVAL = 0.05
 
 
 class ChatService:
@@ -70,13 +77,105 @@ class ChatService:
         AttachmentType.AUDIO: AudioUrl,
         AttachmentType.DOCUMENT: DocumentUrl,
     }
+    # Attachment types passed to the model by storage path rather than download URL
+    _STORAGE_PATH_ATTACHMENT_TYPES = frozenset({AttachmentType.VIDEO, AttachmentType.AUDIO})
+
+    # Model capability registry and lookups shared across requests, since loading the registry
+    # parses its JSON data files. Both are refreshed every MODEL_REGISTRY_TTL seconds.
+    _model_registry: CapabilityRegistry | None = None
+    _model_registry_loaded_at: float = 0.0
+    _model_capabilities: ClassVar[dict[str, ModelCapabilities | None]] = {}
+
+    # Message status updates are queued and written in batches by a single writer task per process,
+    # started and stopped with the application lifespan. None marks the end of the queue.
+    _status_queue: asyncio.Queue[tuple[UUID, UUID, MessageStatus] | None] | None = None
+    _status_writer: asyncio.Task | None = None
+
+    @classmethod
+    def _get_model_capability(cls, model_name: str) -> ModelCapabilities | None:
+        """
+        Get the registry capabilities for a model, cached per model name.
+        Models missing from the registry are cached as None.
+        """
+        now = time.monotonic()
+        if cls._model_registry is None or now - cls._model_registry_loaded_at > MODEL_REGISTRY_TTL:
+            cls._model_registry = CapabilityRegistry()
+            cls._model_registry_loaded_at = now
+            cls._model_capabilities = {}
+
+        if model_name not in cls._model_capabilities:
+            try:
+                cls._model_capabilities[model_name] = cls._model_registry.get_model(model_id=model_name)
+            except ModelNotFoundError:
+                logger.warning(f"Model {model_name} not found in registry, using default settings")
+                cls._model_capabilities[model_name] = None
+        return cls._model_capabilities[model_name]
+
+    @classmethod
+    def start_status_writer(cls) -> None:
+        """
+        Start the background task that writes queued message status updates.
+        """
+        cls._status_queue = asyncio.Queue()
+        cls._status_writer = asyncio.create_task(cls._write_queued_statuses(cls._status_queue))
+
+    @classmethod
+    async def stop_status_writer(cls) -> None:
+        """
+        Flush the queued message status updates and stop the writer task.
+        """
+        if cls._status_queue is None or cls._status_writer is None:
+            return
+        queue, writer = cls._status_queue, cls._status_writer
+        cls._status_queue = cls._status_writer = None
+        queue.put_nowait(None)
+        await writer
+
+    @staticmethod
+    async def _write_queued_statuses(queue: asyncio.Queue[tuple[UUID, UUID, MessageStatus] | None]) -> None:
+        """
+        Write queued message status updates, batching those that arrive within STATUS_FLUSH_INTERVAL.
+        """
+        while True:
+            item = await queue.get()
+            await asyncio.sleep(STATUS_FLUSH_INTERVAL)
+
+            # Updates are applied in queue order, so the latest status of each message wins
+            updates: dict[UUID, tuple[UUID, UUID, MessageStatus]] = {}
+            stopping = False
+            while True:
+                if item is None:
+                    stopping = True
+                else:
+                    updates[item[1]] = item
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
 
-    def __init__(self) -> None:
-        """Initialize the chat service with database session."""
-        self.model_registry = CapabilityRegistry()
-        # Hold strong references to fire-and-forget background tasks so they are
-        # not garbage-collected mid-flight (see asyncio.create_task docs).
-        self._background_tasks: set[asyncio.Task] = set()
+            if updates:
+                try:
+                    async with AsyncSessionLocal() as db:
+                        await crud_message.bulk_update_status(db=db, updates=list(updates.values()))
+                except (SQLAlchemyError, OSError) as e:
+                    # Status updates are best effort and must not stop the writer
+                    logger.warning(f"Error writing message status updates: {e}")
+                except Exception:
+                    logger.exception("Unexpected error in the message status writer")
+                    raise
+            if stopping:
+                return
+
+    async def _set_message_status(self, session_id: UUID, message_id: UUID, status: MessageStatus) -> None:
+        """
+        Queue a message status update without waiting for it to be written.
+        When the status writer is not running (outside the application lifespan), the update is written
+        inline instead, so successive updates of a message are still applied in order.
+        """
+        if self._status_queue is not None:
+            self._status_queue.put_nowait((session_id, message_id, status))
+            return
+        await self._update_message_status(session_id=session_id, message_id=message_id, status=status)
 
     async def _create_agent(
         self,
@@ -93,52 +192,62 @@ class ChatService:
             toolsets=toolsets,
         )
 
-    async def _process_single_attachment(
-        self, attachment
-    ) -> BinaryContent | ImageUrl | VideoUrl | AudioUrl | DocumentUrl | None:
+    @staticmethod
+    def _read_file_if_exists(file_path: Path) -> bytes | None:
         """
-        Process a single attachment to pydantic_ai compatible format.
+        Read a whole file in one worker thread hand-off, or return None if it does not exist.
         """
-        if not attachment.storage_path:
+        try:
+            return file_path.read_bytes()
+        except FileNotFoundError:
             return None
 
-        # Handle localhost case with binary content
-        if settings.STORAGE_PROVIDER == StorageProvider.LOCAL:
-            file_path = Path(attachment.storage_path)
-            if file_path.exists():
-                async with aiofiles.open(file_path, "rb") as f:
-                    content = await f.read()
-                return BinaryContent(data=content, media_type=attachment.mime_type)
+    async def _read_local_attachment(self, attachment) -> BinaryContent | None:
+        """
+        Read a locally stored attachment as binary content.
+        """
+        content = await asyncio.to_thread(self._read_file_if_exists, Path(attachment.storage_path))
+        if content is None:
             return None
+        return BinaryContent(data=content, media_type=attachment.mime_type)
 
-        # Handle remote URLs
-        attachment_url = get_attachment_download_url(storage_path=attachment.storage_path)
+    def _remote_attachment_url(self, attachment) -> ImageUrl | VideoUrl | AudioUrl | DocumentUrl | None:
+        """
+        Build the pydantic_ai URL part for a remotely stored attachment.
+        """
         attachment_class = self._ATTACHMENT_TYPE_MAP.get(attachment.type)
-
-        if attachment_class:
-            # Use storage_path for VIDEO/AUDIO, attachment_url for IMAGE/DOCUMENT
-            url = (
-                attachment.storage_path
-                if attachment.type in (AttachmentType.VIDEO, AttachmentType.AUDIO)
-                else attachment_url
-            )
-            return attachment_class(url=url)
-        else:
+        if not attachment_class:
             logger.warning(f"Unsupported attachment: ID: {attachment.id}: Type: {attachment.type}")
             return None
 
+        # Use storage_path for VIDEO/AUDIO, the download URL (built only when needed) for IMAGE/DOCUMENT
+        if attachment.type in self._STORAGE_PATH_ATTACHMENT_TYPES:
+            return attachment_class(url=attachment.storage_path)
+        return attachment_class(url=get_attachment_download_url(storage_path=attachment.storage_path))
+
     async def _convert_attachments_to_pydantic(
         self, message: ChatMessage
     ) -> list[BinaryContent | ImageUrl | VideoUrl | AudioUrl | DocumentUrl] | None:
         """
         Convert message attachments to pydantic_ai compatible formats.
         """
-        if not message.direct_attachments:
+        attachments = [attachment for attachment in message.direct_attachments if attachment.storage_path]
+        if not attachments:
             return None
 
-        attachment_tasks = [self._process_single_attachment(attachment) for attachment in message.direct_attachments]
-
-        results = await asyncio.gather(*attachment_tasks, return_exceptions=True)
+        if settings.STORAGE_PROVIDER == StorageProvider.LOCAL:
+            # Local files are read concurrently; a failed read only drops that attachment
+            results = await asyncio.gather(
+                *(self._read_local_attachment(attachment) for attachment in attachments), return_exceptions=True
+            )
+        else:
+            # Remote attachments only need their URLs built, so no tasks are scheduled for them
+            results = []
+            for attachment in attachments:
+                try:
+                    results.append(self._remote_attachment_url(attachment))
+                except Exception as e:
+                    results.append(e)
 
         data = []
         for result in results:
@@ -150,36 +259,19 @@ class ChatService:
 
         return data if data else None
 
-    async def _prepare_message_history(self, session_id: UUID, current_message: ChatMessage) -> list[ModelMessage]:
+    @staticmethod
+    def _prepare_message_history(recent_messages: Sequence[ChatMessage]) -> list[ModelMessage]:
         """
-        Prepare message history with recent messages from the session.
+        Convert recent session messages (newest first) into the chronological message history.
         """
-        try:
-            async with AsyncSessionLocal() as db:
-                message_service = ChatMessageService(db=db)
-                recent_messages = await message_service.get_session_context(
-                    session_id=session_id,
-                    exclude_message_id=current_message.id if current_message else None,
-                )
-
-                # Reverse to get chronological order (oldest first) for LLM context
-                if recent_messages:
-                    recent_messages = list(reversed(recent_messages))
-
-                # Convert database messages to ModelMessage objects
-                message_history = []
-                for msg in recent_messages or []:
-                    content = msg.content or ""
-                    if msg.role == MessageRole.USER.value:
-                        message_history.append(ModelRequest(parts=[UserPromptPart(content=content)]))
-                    elif msg.role == MessageRole.ASSISTANT.value:
-                        message_history.append(ModelResponse(parts=[TextPart(content=content)]))
-
-                return message_history
-
-        except (SQLAlchemyError, AttributeError, TypeError) as e:
-            logger.warning(f"Error retrieving message history: {e}")
-            return []
+        message_history: list[ModelMessage] = []
+        for msg in reversed(recent_messages):
+            content = msg.content or ""
+            if msg.role == MessageRole.USER.value:
+                message_history.append(ModelRequest(parts=[UserPromptPart(content=content)]))
+            elif msg.role == MessageRole.ASSISTANT.value:
+                message_history.append(ModelResponse(parts=[TextPart(content=content)]))
+        return message_history
 
     def _prepare_model_settings(
         self,
@@ -251,6 +343,7 @@ class ChatService:
         temperature: float | None = None,
         max_tokens: int | None = None,
         top_p: float | None = None,
+        include_thinking: bool = True,
     ) -> AsyncIterator[str]:
         """
         Stream a response for an existing message using pydantic_ai.
@@ -263,6 +356,7 @@ class ChatService:
             temperature: Optional temperature override
             max_tokens: Optional max tokens override
             top_p: Optional top_p override
+            include_thinking: Whether to stream the ephemeral thinking (UI status) blocks
         Yields:
             JSON-serialized StreamBlock objects containing rich streaming information
         Raises:
@@ -271,63 +365,74 @@ class ChatService:
         """
         # Initialize tool call tracker and stream block collection
         tool_tracker = ToolCallTracker()
-        stream_blocks: list[dict[str, Any]] = []
+        # Blocks are appended to a single comma separated buffer of the JSON already sent to the client,
+        # and decoded once when the message is saved
+        stream_blocks_buffer = bytearray()
 
         def collect_and_yield_block(block) -> str:
             """Helper to collect stream blocks and yield JSON"""
+            block_json = block.model_dump_json()
             # Store all blocks except ephemeral UI thinking blocks
             # reasoning blocks ARE stored (they contain actual model reasoning)
             if block.type != "thinking":
-                stream_blocks.append(block.model_dump())
+                if stream_blocks_buffer:
+                    stream_blocks_buffer += b","
+                stream_blocks_buffer += block_json.encode()
             # Yield all blocks for streaming (thinking + reasoning + content)
-            return block.model_dump_json()
+            return block_json
 
+        # One database session serves the initial read and the final write of this request
+        db = AsyncSessionLocal()
+        message_service = ChatMessageService(db=db)
+        completed = False
         try:
-            initial_block = StreamBlockFactory.create_thinking_block("Processing your request...")
-            yield collect_and_yield_block(initial_block)
+            if include_thinking:
+                initial_block = StreamBlockFactory.create_thinking_block("Processing your request...")
+                yield collect_and_yield_block(initial_block)
 
-            status_task = asyncio.create_task(
-                self._update_message_status(
-                    session_id=session_id, message_id=message_id, status=MessageStatus.PROCESSING
-                )
+            await self._set_message_status(
+                session_id=session_id, message_id=message_id, status=MessageStatus.PROCESSING
             )
-            self._background_tasks.add(status_task)
-            status_task.add_done_callback(self._background_tasks.discard)
 
-            async with AsyncSessionLocal() as db:
-                message_service = ChatMessageService(db=db)
-                current_message = await message_service.get_message(session_id=session_id, message_id=message_id)
-                if not current_message or not current_message.content:
-                    raise ValueError(f"Message {message_id} not found or has no content")
+            # Load the session context and the message with a single connection checkout. The context goes
+            # first, so a failure there can be rolled back without expiring an already loaded message.
+            try:
+                recent_messages = await message_service.get_session_context(
+                    session_id=session_id, exclude_message_id=message_id
+                )
+            except SQLAlchemyError as e:
+                # Continue without history rather than failing the whole response
+                logger.warning(f"Error retrieving message history: {e}")
+                await db.rollback()
+                recent_messages = []
+            current_message = await message_service.get_message(session_id=session_id, message_id=message_id)
+            # End the read transaction so no connection is held while the model streams. Commit rather than
+            # roll back, since a rollback would expire the loaded messages.
+            await db.commit()
+            if not current_message or not current_message.content:
+                raise ValueError(f"Message {message_id} not found or has no content")
+
+            try:
+                model_capability = self._get_model_capability(model.name)
+            except Exception as e:
+                logger.warning(f"Error getting model capability: {e}")
+                model_capability = None
 
-            async def get_model_capability():
-                try:
-                    return self.model_registry.get_model(model_id=model.name)
-                except ModelNotFoundError:
-                    logger.warning(f"Model {model.name} not found in registry, using default settings")
-                    return None
-
-            toolsets_task = mcp_lifecycle_manager.get_running_servers()
-            message_history_task = self._prepare_message_history(session_id=session_id, current_message=current_message)
-            attachment_task = self._convert_attachments_to_pydantic(current_message)
-            model_capability_task = get_model_capability()
-
-            toolsets, message_history, attachment_messages, model_capability = await asyncio.gather(
-                toolsets_task, message_history_task, attachment_task, model_capability_task, return_exceptions=True
-            )
+            # The loop's eager task factory (set in the lifespan) runs these inline until their first await,
+            # so a step with nothing to wait for (e.g. a message without attachments) finishes without a loop hop
+            toolsets_task = asyncio.create_task(mcp_lifecycle_manager.get_running_servers())
+            attachment_task = asyncio.create_task(self._convert_attachments_to_pydantic(current_message))
+
+            message_history = self._prepare_message_history(recent_messages)
+
+            toolsets, attachment_messages = await asyncio.gather(toolsets_task, attachment_task, return_exceptions=True)
 
             if isinstance(toolsets, Exception):
                 logger.warning(f"Error getting MCP servers: {toolsets}")
                 toolsets = []
-            if isinstance(message_history, Exception):
-                logger.warning(f"Error retrieving message history: {message_history}")
-                message_history = []
             if isinstance(attachment_messages, Exception):
                 logger.warning(f"Error processing attachments: {attachment_messages}")
                 attachment_messages = None
-            if isinstance(model_capability, Exception):
-                logger.warning(f"Error getting model capability: {model_capability}")
-                model_capability = None
 
             logger.debug(f"Retrieved {len(toolsets)} running MCP servers for agent")
 
@@ -360,20 +465,103 @@ class ChatService:
                 async for node in run:
                     if agent.is_user_prompt_node(node):
                         # User prompt node - show processing message
-                        thinking_block = StreamBlockFactory.create_thinking_block("Understanding your request...")
-                        yield collect_and_yield_block(thinking_block)
+                        if include_thinking:
+                            thinking_block = StreamBlockFactory.create_thinking_block("Understanding your request...")
+                            yield collect_and_yield_block(thinking_block)
 
                     elif agent.is_model_request_node(node):
                         # Model request node - show response generation
-                        thinking_block = StreamBlockFactory.create_thinking_block("Thinking about your request...")
-                        yield collect_and_yield_block(thinking_block)
+                        if include_thinking:
+                            thinking_block = StreamBlockFactory.create_thinking_block("Thinking about your request...")
+                            yield collect_and_yield_block(thinking_block)
 
                         async with node.stream(run.ctx) as request_stream:
-                            async for event in request_stream:
-                                if isinstance(event, PartStartEvent):
+                            # Consecutive text deltas (often a few characters each) are sent as one block
+                            text_buffer: list[str] = []
+                            text_buffer_size = 0
+                            # Starts at zero so the first text of the stream is always sent immediately
+                            last_text_flush = 0.0
+                            events = aiter(request_stream)
+                            while True:
+                                if text_buffer:
+                                    # Buffered text waits at most one flush interval for the next event,
+                                    # so a model pause or network stall cannot hold back the tail of a burst
+                                    next_event = asyncio.ensure_future(anext(events, None))
+                                    try:
+                                        done, _ = await asyncio.wait((next_event,), timeout=TEXT_DELTA_FLUSH_INTERVAL)
+                                        if not done:
+                                            yield StreamBlockFactory.text_delta_json("".join(text_buffer))
+                                            text_buffer.clear()
+                                            text_buffer_size = 0
+                                            last_text_flush = time.monotonic()
+                                    except BaseException:
+                                        next_event.cancel()
+                                        raise
+                                    event = await next_event
+                                else:
+                                    event = await anext(events, None)
+                                if event is None:
+                                    break
+
+                                # Text deltas are by far the most frequent events, so they are checked first
+                                if isinstance(event, PartDeltaEvent) and isinstance(event.delta, TextPartDelta):
+                                    content = event.delta.content_delta
+                                    if content:
+                                        now = time.monotonic()
+                                        # The first delta after a quiet period is sent right away rather than
+                                        # buffered, so it cannot be held back by a pause that follows it
+                                        quiet_period = now - last_text_flush >= TEXT_DELTA_FLUSH_INTERVAL
+                                        text_buffer.append(content)
+                                        text_buffer_size += len(content)
+                                        if quiet_period or text_buffer_size >= TEXT_DELTA_FLUSH_SIZE:
+                                            yield StreamBlockFactory.text_delta_json("".join(text_buffer))
+                                            text_buffer.clear()
+                                            text_buffer_size = 0
+                                            last_text_flush = now
+                                    continue
+
+                                # Any other event ends the run of text deltas, so the buffered text goes first
+                                if text_buffer:
+                                    yield StreamBlockFactory.text_delta_json("".join(text_buffer))
+                                    text_buffer.clear()
+                                    text_buffer_size = 0
+                                    last_text_flush = time.monotonic()
+
+                                if isinstance(event, PartDeltaEvent):
+                                    if isinstance(event.delta, ThinkingPartDelta):
+                                        # Streaming reasoning content as it's generated
+                                        content_delta = event.delta.content_delta
+                                        if content_delta:
+                                            reasoning_delta = StreamBlockFactory.create_reasoning_block(
+                                                content=content_delta
+                                            )
+                                            yield collect_and_yield_block(reasoning_delta)
+
+                                    elif isinstance(event.delta, ToolCallPartDelta):
+                                        # Tool call arguments being built - stream raw delta chunks
+                                        args_delta = event.delta.args_delta
+                                        if args_delta:
+                                            # Get the tool call ID using part index mapping
+                                            tool_call_id = tool_tracker.get_tool_call_id_by_part_index(event.index)
+                                            if tool_call_id:
+                                                # Get tool info for the args delta block
+                                                tool_info = tool_tracker.get_tool_info(tool_call_id)
+                                                tool_name = (
+                                                    tool_info.get("tool_name", "unknown") if tool_info else "unknown"
+                                                )
+
+                                                # Stream the raw delta chunk. It is not stored: the complete
+                                                # arguments are stored with the tool call event block
+                                                yield StreamBlockFactory.tool_args_delta_json(
+                                                    tool_name=tool_name,
+                                                    tool_call_id=tool_call_id,
+                                                    args_delta=str(args_delta),
+                                                )
+
+                                elif isinstance(event, PartStartEvent):
                                     if isinstance(event.part, ThinkingPart):
                                         # Reasoning model thinking - capture actual model reasoning
-                                        reasoning_content = getattr(event.part, "content", "")
+                                        reasoning_content = event.part.content
                                         if reasoning_content:
                                             reasoning_block = StreamBlockFactory.create_reasoning_block(
                                                 content=reasoning_content
@@ -382,17 +570,18 @@ class ChatService:
 
                                     elif isinstance(event.part, ToolCallPart):
                                         # Tool call starting - show thinking and tool info
-                                        tool_name = getattr(event.part, "tool_name", "unknown")
-                                        tool_call_id = getattr(event.part, "tool_call_id", f"part_{event.index}")
+                                        tool_name = event.part.tool_name or "unknown"
+                                        tool_call_id = event.part.tool_call_id or f"part_{event.index}"
 
                                         # Start tracking this tool call with part index mapping
                                         tool_tracker.start_tool_call(tool_call_id, tool_name, event.index)
 
                                         # Show user-friendly thinking message for any MCP tool
-                                        thinking_block = StreamBlockFactory.create_thinking_block(
-                                            f"Let me use {tool_name} to help with that..."
-                                        )
-                                        yield collect_and_yield_block(thinking_block)
+                                        if include_thinking:
+                                            thinking_block = StreamBlockFactory.create_thinking_block(
+                                                f"Let me use {tool_name} to help with that..."
+                                            )
+                                            yield collect_and_yield_block(thinking_block)
 
                                         # Show tool call start
                                         tool_start_block = StreamBlockFactory.create_tool_start_block(
@@ -403,60 +592,26 @@ class ChatService:
 
                                     elif isinstance(event.part, TextPart):
                                         # Text response starting - yield the initial content
-                                        text_content = getattr(event.part, "content", "")
+                                        text_content = event.part.content
                                         if text_content:
-                                            yield StreamBlockFactory.create_text_delta_block(
-                                                text_content
-                                            ).model_dump_json()
-
-                                elif isinstance(event, PartDeltaEvent):
-                                    if isinstance(event.delta, ThinkingPartDelta):
-                                        # Streaming reasoning content as it's generated
-                                        content_delta = getattr(event.delta, "content_delta", "")
-                                        if content_delta:
-                                            reasoning_delta = StreamBlockFactory.create_reasoning_block(
-                                                content=content_delta
-                                            )
-                                            yield collect_and_yield_block(reasoning_delta)
-
-                                    elif isinstance(event.delta, TextPartDelta):
-                                        # Text content delta
-                                        content = event.delta.content_delta
-                                        if content:
-                                            yield StreamBlockFactory.create_text_delta_block(content).model_dump_json()
+                                            yield StreamBlockFactory.text_delta_json(text_content)
+                                            last_text_flush = time.monotonic()
 
-                                    elif isinstance(event.delta, ToolCallPartDelta):
-                                        # Tool call arguments being built - stream raw delta chunks
-                                        args_delta = event.delta.args_delta
-                                        if args_delta:
-                                            # Get the tool call ID using part index mapping
-                                            tool_call_id = tool_tracker.get_tool_call_id_by_part_index(event.index)
-                                            if tool_call_id:
-                                                # Get tool info for the args delta block
-                                                tool_info = tool_tracker.get_tool_info(tool_call_id)
-                                                tool_name = (
-                                                    tool_info.get("tool_name", "unknown") if tool_info else "unknown"
-                                                )
-
-                                                # Create and stream the args delta block with raw delta
-                                                args_delta_block = StreamBlockFactory.create_tool_args_delta_block(
-                                                    tool_name=tool_name,
-                                                    tool_call_id=tool_call_id,
-                                                    args_delta=str(args_delta),
-                                                )
-                                                yield collect_and_yield_block(args_delta_block)
-
-                                elif isinstance(event, FinalResultEvent):
+                                elif isinstance(event, FinalResultEvent) and include_thinking:
                                     # Final result from model - show completion
                                     thinking_block = StreamBlockFactory.create_final_result_event_block(
                                         tool_name=event.tool_name
                                     )
                                     yield collect_and_yield_block(thinking_block)
 
+                            if text_buffer:
+                                yield StreamBlockFactory.text_delta_json("".join(text_buffer))
+
                     elif agent.is_call_tools_node(node):
                         # Tool execution node - show tool calls and results
-                        thinking_block = StreamBlockFactory.create_call_tools_node_start_block()
-                        yield collect_and_yield_block(thinking_block)
+                        if include_thinking:
+                            thinking_block = StreamBlockFactory.create_call_tools_node_start_block()
+                            yield collect_and_yield_block(thinking_block)
 
                         async with node.stream(ctx=run.ctx) as handle_stream:
                             async for event in handle_stream:
@@ -464,11 +619,16 @@ class ChatService:
                                     # Tool is being called - show complete call info
                                     tool_args = event.part.args
                                     if isinstance(tool_args, str):
-                                        # Try to parse JSON string
-                                        try:
-                                            tool_args = json.loads(tool_args)
-                                        except (json.JSONDecodeError, TypeError):
-                                            tool_args = {"raw_args": tool_args}
+                                        # Only a JSON object can be used as tool_args, so other strings skip the parse
+                                        parsed_args = None
+                                        if tool_args.lstrip().startswith("{"):
+                                            try:
+                                                parsed_args = json.loads(tool_args)
+                                            except json.JSONDecodeError:
+                                                pass
+                                        if not isinstance(parsed_args, dict):
+                                            parsed_args = {"raw_args": tool_args}
+                                        tool_args = parsed_args
                                     elif not isinstance(tool_args, dict):
                                         tool_args = {"args": tool_args}
 
@@ -509,9 +669,10 @@ class ChatService:
                                     yield collect_and_yield_block(tool_result_block)
 
                                     # Show user-friendly interpretation
-                                    interpretation = f"Got some helpful information from {tool_name}"
-                                    interpretation_block = StreamBlockFactory.create_thinking_block(interpretation)
-                                    yield collect_and_yield_block(interpretation_block)
+                                    if include_thinking:
+                                        interpretation = f"Got some helpful information from {tool_name}"
+                                        interpretation_block = StreamBlockFactory.create_thinking_block(interpretation)
+                                        yield collect_and_yield_block(interpretation_block)
 
                                     # Clean up tool tracking for completed call
                                     tool_tracker.cleanup_tool_call(event.tool_call_id)
@@ -533,32 +694,32 @@ class ChatService:
                     status=MessageStatus.COMPLETED,
                     parent_id=message_id,
                     extra_data={
-                        "stream_blocks": stream_blocks,
+                        "stream_blocks": json.loads(b"[" + stream_blocks_buffer + b"]"),
                     },
                 )
 
                 # Add usage data if available
                 if usage_data:
+                    input_tokens = getattr(usage_data, "input_tokens", 0)
+                    output_tokens = getattr(usage_data, "output_tokens", 0)
                     costs = self._calculate_cost(
                         model=model,
-                        input_tokens=getattr(usage_data, "input_tokens", 0),
-                        output_tokens=getattr(usage_data, "output_tokens", 0),
+                        input_tokens=input_tokens,
+                        output_tokens=output_tokens,
                         model_capability=model_capability,
                     )
                     assistant_message.usage = MessageUsage(
-                        input_tokens=getattr(usage_data, "input_tokens", 0),
-                        output_tokens=getattr(usage_data, "output_tokens", 0),
+                        input_tokens=input_tokens,
+                        output_tokens=output_tokens,
                         input_cost=costs["input_cost"],
                         output_cost=costs["output_cost"],
                     )
 
                 # Save the complete message to database for persistence
-                async with AsyncSessionLocal() as db:
-                    message_service = ChatMessageService(db=db)
-                    created_message = await message_service.create_message(
-                        message_in=assistant_message,
-                        session_id=session_id,
-                    )
+                created_message = await message_service.create_message(
+                    message_in=assistant_message,
+                    session_id=session_id,
+                )
 
                 # Send final message block with the persisted message data and usage
                 final_block = StreamBlockFactory.create_done_block(content=final_output)
@@ -567,7 +728,8 @@ class ChatService:
                 yield collect_and_yield_block(final_block)
 
             # Update original message status to completed
-            await self._update_message_status(session_id, message_id, MessageStatus.COMPLETED)
+            await self._set_message_status(session_id=session_id, message_id=message_id, status=MessageStatus.COMPLETED)
+            completed = True
         except ValidationError as error:
             logger.error(f"Validation error in stream_response: {error}")
             raise ValueError(f"Invalid input data: {error}") from error
@@ -579,15 +741,17 @@ class ChatService:
             raise
         finally:
             # Clean up tool tracker state after streaming completes
-            if "tool_tracker" in locals():
-                tool_tracker.reset()
+            tool_tracker.reset()
 
-            # Update message status to failed if we're in an exception context
-            if sys.exc_info()[0] is not None:
-                await self._update_message_status(
+            # Update message status to failed if the stream did not run to completion, including
+            # when it was cancelled or closed early by the client
+            if not completed:
+                await self._set_message_status(
                     session_id=session_id, message_id=message_id, status=MessageStatus.FAILED
                 )
 
+            await db.close()
+
     def _calculate_cost(
         self, model: LLMModel, input_tokens: int, output_tokens: int, model_capability: ModelCapabilities | None = None
     ) -> dict[str, float]:
@@ -1,14 +1,66 @@
-import json
+import asyncio
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import BackgroundTasks, Depends
 from loguru import logger
-from redis.asyncio import Redis, ConnectionPool
+from pydantic_core import to_json
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import RedisError
 
 from app.core.config import settings
 
+# Checks the cancel flag and session key, then publishes the chunk, all in one round trip.
+# When a TTL is passed as ARGV[2] (first chunk of a stream), the session key is created instead of checked.
+# Returns -1 if the stream was cancelled, -2 if the session expired, otherwise the PUBLISH result.
+PUBLISH_CHUNK_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return -1
+end
+if ARGV[2] then
+    redis.call('SETEX', KEYS[2], ARGV[2], 'active')
+elseif redis.call('EXISTS', KEYS[2]) == 0 then
+    return -2
+end
+return redis.call('PUBLISH', KEYS[3], ARGV[1])
+"""
+STREAM_CANCELLED = -1
+SESSION_EXPIRED = -2
+
+# TTL of the session key in seconds
+SESSION_TTL = 3600
+
+# Stop signals are published on this channel prefix (and also stored under the same key name)
+CANCEL_PREFIX = "sse:cancel:"
+# Number of chunks between full cancel flag / session checks in Redis. In between, a stream
+# only consults its in-process cancel event, which is set by the shared cancel listener.
+STATE_CHECK_INTERVAL = 20
+
+# SSE framing, pre-encoded so each event is a single bytes concatenation
+SSE_DATA_PREFIX = b"data: "
+SSE_EVENT_SUFFIX = b"\n\n"
+
+
+@dataclass(slots=True, frozen=True)
+class SessionKeys:
+    """
+    Redis key and channel names of a session, built and encoded once per session.
+    """
+
+    session: bytes
+    stream: bytes
+    cancel: bytes
+
+    @classmethod
+    def for_session(cls, session_id: UUID) -> "SessionKeys":
+        return cls(
+            session=f"sse:session:{session_id}".encode(),
+            stream=f"sse:stream:{session_id}".encode(),
+            cancel=f"{CANCEL_PREFIX}{session_id}".encode(),
+        )
+
 
 class SSEConnectionManager:
     """
@@ -17,115 +69,198 @@ class SSEConnectionManager:
 
     def __init__(self, redis: Redis) -> None:
         self.redis = redis
+        # Cached by SHA and executed with EVALSHA (falls back to EVAL if the script cache is flushed)
+        self.publish_chunk = redis.register_script(PUBLISH_CHUNK_SCRIPT)
+        # Cancel events of the streams running in this process, keyed by session id
+        self._cancel_events: dict[str, set[asyncio.Event]] = {}
+        self._cancel_listener: asyncio.Task | None = None
 
     @classmethod
     async def create(cls) -> "SSEConnectionManager":
         """
         Factory method to create connection manager with Redis connection pool.
         """
-        pool = ConnectionPool.from_url(
+        # Under a burst beyond MAX_CONNECTIONS, requests wait for a free connection instead of failing
+        pool = BlockingConnectionPool.from_url(
             url=str(settings.REDIS.DSN),
             encoding="utf-8",
-            decode_responses=True,
+            # Replies are only integers and pub/sub payloads, so they are left undecoded
+            decode_responses=False,
             socket_keepalive=True,
             health_check_interval=30,
-            max_connections=20,
+            max_connections=settings.REDIS.MAX_CONNECTIONS,
+            timeout=settings.REDIS.POOL_TIMEOUT,
             retry_on_timeout=True,
         )
         redis = Redis(connection_pool=pool)
         return cls(redis=redis)
 
-    async def connect(self, session_id: UUID) -> None:
+    async def warm_up(self, connections: int) -> None:
         """
-        Ensure a session key exists in Redis for tracking TTL.
+        Open pool connections ahead of the first requests; concurrent pings each check out their own connection.
         """
-        session_key = f"sse:session:{session_id}"
-        await self.redis.setex(session_key, 3600, "active")  # Set a 1-hour TTL
+        try:
+            await asyncio.gather(*(self.redis.ping() for _ in range(connections)))
+        except (RedisError, OSError) as error:
+            # Connections are still opened on demand, so a failed warm-up is not fatal
+            logger.warning(f"Redis connection warm-up failed: {error}")
+        except Exception:
+            logger.exception("Unexpected error while warming up Redis connections")
+            raise
 
-    async def disconnect(self, session_id: UUID) -> None:
+    async def disconnect(self, session_id: UUID, keys: SessionKeys | None = None) -> None:
         """
         Cleanup session-specific keys when the connection is terminated.
         """
-        session_key = f"sse:session:{session_id}"
-        cancel_key = f"sse:cancel:{session_id}"
-        await self.redis.delete(session_key)
-        await self.redis.delete(cancel_key)  # Remove cancel flag
+        keys = keys or SessionKeys.for_session(session_id)
+        await self.redis.delete(keys.session)
+        await self.redis.delete(keys.cancel)  # Remove cancel flag
 
     async def stop_stream(self, session_id: UUID) -> None:
         """
-        Stop an ongoing streaming session by setting a cancellation flag.
+        Stop an ongoing streaming session by setting a cancellation flag and notifying listeners.
         """
-        cancel_key = f"sse:cancel:{session_id}"
-        await self.redis.set(cancel_key, "1", ex=10)  # Set cancel flag for 10 sec
+        keys = SessionKeys.for_session(session_id)
+        await self.redis.set(keys.cancel, "1", ex=10)  # Set cancel flag for 10 sec
+        await self.redis.publish(keys.cancel, "1")  # Notify running streams immediately
         logger.info(f"Stop signal sent for session {session_id}")
 
+    def _ensure_cancel_listener(self) -> None:
+        """
+        Start the shared cancel listener if it is not already running.
+        """
+        if self._cancel_listener is None or self._cancel_listener.done():
+            self._cancel_listener = asyncio.create_task(self._listen_for_cancellations())
+
+    async def _listen_for_cancellations(self) -> None:
+        """
+        Listen for stop signals on all cancel channels with a single pattern subscription
+        and set the cancel events of the matching streams in this process.
+        """
+        # Subscription confirmations are dropped by redis-py, so only stop signals reach the loop
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.psubscribe(f"{CANCEL_PREFIX}*")
+            async for message in pubsub.listen():
+                session_id = message["channel"].decode().removeprefix(CANCEL_PREFIX)
+                for cancel_event in self._cancel_events.get(session_id, ()):
+                    cancel_event.set()
+        except (RedisError, OSError) as error:
+            # Streams still pick up the cancel flag through the periodic state check
+            logger.error(f"Cancel listener stopped: {error}")
+        except Exception:
+            logger.exception("Unexpected error in the cancel listener")
+            raise
+        finally:
+            await pubsub.aclose()
+
+    @staticmethod
+    def _is_stream_stopped(session_id: UUID, publish_result: int) -> bool:
+        """
+        Whether a publish script result means the stream was cancelled or its session expired.
+        """
+        if publish_result == STREAM_CANCELLED:
+            logger.warning(f"Stream cancelled for session {session_id}")
+            return True
+        return publish_result == SESSION_EXPIRED
+
     async def stream_generator(
         self,
         session_id: UUID,
         generator: AsyncGenerator[str, None],
         background_tasks: BackgroundTasks,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """
         Streams data for the session using Redis Pub/Sub.
         """
-        session_key = f"sse:session:{session_id}"
-        pubsub_channel = f"sse:stream:{session_id}"
-        cancel_key = f"sse:cancel:{session_id}"
+        keys = SessionKeys.for_session(session_id)
+        script_keys = [keys.cancel, keys.session, keys.stream]
+
+        pending_publish: asyncio.Future | None = None
+        cancel_event = asyncio.Event()
+        cancel_events = self._cancel_events.setdefault(str(session_id), set())
+        cancel_events.add(cancel_event)
+        self._ensure_cancel_listener()
 
         try:
             logger.info(f"Starting stream for session {session_id}")
-            # Ensure the session is active
-            await self.connect(session_id=session_id)
 
             # Publish messages to the channel as they are generated
+            chunk_count = 0
             async for chunk in generator:
-                # Use Redis pipeline to batch operations
-                pipe = self.redis.pipeline()
-                pipe.exists(cancel_key)  # Check for stop signal
-                pipe.exists(session_key)  # Check session exists
-                pipe.publish(pubsub_channel, chunk)  # Publish chunk
-
-                results = await pipe.execute()
-                cancel_exists, session_exists, _ = results
-
-                if cancel_exists:
+                if cancel_event.is_set():
                     logger.warning(f"Stream cancelled for session {session_id}")
                     break
-                if not session_exists:
-                    break
+
+                if pending_publish is not None:
+                    # The previous chunk was published while this one was produced. Wait for it first,
+                    # so at most one publish is in flight and chunks reach subscribers in order.
+                    result = await pending_publish
+                    pending_publish = None
+                    if self._is_stream_stopped(session_id, result):
+                        break
+
+                if chunk_count == 0:
+                    # Check for stop signal, mark the session active and publish the first chunk in one call.
+                    # This also catches stop signals sent before the cancel listener was subscribed.
+                    result = await self.publish_chunk(keys=script_keys, args=[chunk, SESSION_TTL])
+                    if self._is_stream_stopped(session_id, result):
+                        break
+                elif chunk_count % STATE_CHECK_INTERVAL == 0:
+                    # Check for stop signal and session, then publish the chunk in a single script call
+                    pending_publish = asyncio.ensure_future(self.publish_chunk(keys=script_keys, args=[chunk]))
+                else:
+                    pending_publish = asyncio.ensure_future(self.redis.publish(keys.stream, chunk))
+                chunk_count += 1
 
                 # Format as proper SSE data
-                yield f"data: {chunk}\n\n"
+                yield SSE_DATA_PREFIX + chunk.encode() + SSE_EVENT_SUFFIX
+
+            # Make sure the last chunk is published before the session is cleaned up
+            if pending_publish is not None:
+                await pending_publish
 
         except Exception as error:
             error_message = str(error)
             logger.error(f"Unexpected stream error for session {session_id}: {error_message}")
 
             response = {"type": "error", "message": error_message}
-            yield f"data: {json.dumps(response)}\n\n"
+            yield SSE_DATA_PREFIX + to_json(response) + SSE_EVENT_SUFFIX
 
         finally:
+            # Stop a publish left in flight when the stream is closed early or fails
+            if pending_publish is not None:
+                pending_publish.cancel()
+            cancel_events.discard(cancel_event)
+            if not cancel_events:
+                self._cancel_events.pop(str(session_id), None)
             # Cleanup the session on disconnect
-            background_tasks.add_task(self.disconnect, session_id)
+            background_tasks.add_task(self.disconnect, session_id, keys)
 
     async def cleanup(self) -> None:
         """
         Gracefully shutdown Redis connections.
         """
+        if self._cancel_listener:
+            self._cancel_listener.cancel()
         await self.redis.close()
 
 
 # Initialize manager
-manager = None
+manager: SSEConnectionManager | None = None
+_manager_lock = asyncio.Lock()
 
 
 async def get_sse_manager() -> SSEConnectionManager:
     """
     Get or create SSE manager instance.
+    Creation is guarded by a lock so concurrent first requests share a single connection pool.
     """
     global manager
     if manager is None:
-        manager = await SSEConnectionManager.create()
+        async with _manager_lock:
+            if manager is None:
+                manager = await SSEConnectionManager.create()
     return manager
 
 
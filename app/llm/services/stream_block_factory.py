@@ -1,3 +1,5 @@
+import json
+from datetime import datetime, timezone
 from typing import Any
 
 from mcp.types import EmbeddedResource, ImageContent, TextContent
@@ -5,6 +7,27 @@ from mcp.types import EmbeddedResource, ImageContent, TextContent
 from app.llm.schemas.stream import StreamBlock, StreamBlockType
 
 
+def _block_json_template(block_type: StreamBlockType, *fields: str) -> str:
+    """
+    Build a str.format template for a StreamBlock JSON document, in the same field order as model_dump_json().
+    The given fields and the timestamp are placeholders expecting JSON encoded values; other fields are null.
+    """
+    parts = []
+    for name in StreamBlock.model_fields:
+        if name == "type":
+            parts.append(f'"type":"{block_type.value}"')
+        elif name in fields or name == "timestamp":
+            parts.append(f'"{name}":{{{name}}}')
+        else:
+            parts.append(f'"{name}":null')
+    return "{{" + ",".join(parts) + "}}"
+
+
+# Per-token delta blocks are serialized from these templates, skipping StreamBlock validation and serialization
+_TEXT_DELTA_TEMPLATE = _block_json_template(StreamBlockType.CONTENT, "content")
+_TOOL_ARGS_DELTA_TEMPLATE = _block_json_template(StreamBlockType.TOOL_CALL, "tool_name", "tool_call_id", "args_delta")
+
+
 class StreamBlockFactory:
     """
     Manages creation and handling of stream blocks.
@@ -135,6 +158,18 @@ class StreamBlockFactory:
             content=content_delta,
         )
 
+    @staticmethod
+    def text_delta_json(content_delta: str) -> str:
+        """
+        Serialize a text delta block straight to JSON.
+        Equivalent to create_text_delta_block(...).model_dump_json(), without the model
+        validation and serialization on the per-token hot path.
+        """
+        return _TEXT_DELTA_TEMPLATE.format(
+            content=json.dumps(content_delta, ensure_ascii=False),
+            timestamp=f'"{datetime.now(timezone.utc).isoformat()}"',
+        )
+
     @staticmethod
     def create_tool_args_delta_block(
         tool_name: str,
@@ -163,6 +198,19 @@ class StreamBlockFactory:
             args_delta=args_delta,  # Stream the raw delta chunk here
         )
 
+    @staticmethod
+    def tool_args_delta_json(tool_name: str, tool_call_id: str, args_delta: str) -> str:
+        """
+        Serialize a tool arguments delta block straight to JSON.
+        Equivalent to create_tool_args_delta_block(...).model_dump_json().
+        """
+        return _TOOL_ARGS_DELTA_TEMPLATE.format(
+            tool_name=json.dumps(tool_name, ensure_ascii=False),
+            tool_call_id=json.dumps(tool_call_id, ensure_ascii=False),
+            args_delta=json.dumps(args_delta, ensure_ascii=False),
+            timestamp=f'"{datetime.now(timezone.utc).isoformat()}"',
+        )
+
     @staticmethod
     def create_function_tool_call_event_block(
         tool_name: str,
@@ -1,9 +1,11 @@
+import asyncio
 from contextlib import asynccontextmanager
 from collections.abc import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.llm.services.chat import ChatService
 from app.llm.services.sse import get_sse_manager
 from app.api.v1.router import api_router
 from app.core.config import settings
@@ -16,13 +18,20 @@ async def lifespan(_: FastAPI) -> AsyncGenerator:
     """
     Context manager to handle the lifespan of the application.
     """
+    # Start tasks eagerly, so short tasks that complete without awaiting skip an event loop iteration
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     # Start enabled MCP servers from database
     await mcp_lifecycle_manager.start_enabled_servers()
+    # Start the writer for queued message status updates
+    ChatService.start_status_writer()
+    # Create the SSE manager and open its first Redis connections before serving requests
+    manager = await get_sse_manager()
+    await manager.warm_up(settings.REDIS.WARM_CONNECTIONS)
     yield
+    # Flush pending message status updates
+    await ChatService.stop_status_writer()
     # Stop all running MCP servers
     await mcp_lifecycle_manager.shutdown()
-    # Get the SSE manager instance
-    manager = await get_sse_manager()
     # Clean up Redis connections
     await manager.cleanup()
 
@@ -147,7 +147,7 @@ class MCPServerDomainService:
             if not is_valid:
                 # Revert the update by setting enabled=False
                 revert_data = MCPServerUpdate(enabled=False)
-                await crud_mcp_server.update(db=self.db, id=server_id, obj_in=revert_data)
+                await crud_mcp_server.update(db=self.db, id=server_id, obj_in=revert_data, returning=False)
                 raise MCPServerError(f"Server validation failed: {error_msg}")
 
         # Determine status based on enabled flag
@@ -1,15 +1,16 @@
 from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import desc, select
+from sqlalchemy import Row, bindparam, desc, null, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
 
 from app.core.constants import MAX_CONTEXT_MESSAGES
 from app.core.database.crud import CRUDBase
 from app.message.constants import MessageRole, MessageStatus
 from app.message.model import ChatMessage, MessageAttachment
 from app.message.schema import MessageCreate, MessageUpdate
+from app.session.model import ChatSession
 
 
 class CRUDMessage(CRUDBase[ChatMessage, MessageCreate, MessageUpdate]):
@@ -30,6 +31,53 @@ class CRUDMessage(CRUDBase[ChatMessage, MessageCreate, MessageUpdate]):
         result = await db.execute(statement)
         return result.scalar_one()
 
+    async def get_in_session(
+        self, db: AsyncSession, session_id: UUID, message_id: UUID
+    ) -> Row[tuple[UUID, ChatMessage | None]] | None:
+        """
+        Get a chat session ID together with a message (and its attachments) in a single query.
+        Args:
+            db: Database session
+            session_id: ID of the chat session
+            message_id: ID of the message to fetch
+        Returns:
+            None if the session does not exist, else a row of (session ID, message).
+            The message is None if it does not exist.
+        """
+        query = (
+            select(ChatSession.id, self.model)
+            .outerjoin(self.model, self.model.id == message_id)
+            .where(ChatSession.id == session_id)
+            .options(selectinload(self.model.direct_attachments))
+        )
+        result = await db.execute(query)
+        return result.first()
+
+    async def get_session_with_parent(
+        self, db: AsyncSession, session_id: UUID, parent_id: UUID | None
+    ) -> Row[tuple[UUID, UUID | None]] | None:
+        """
+        Get a chat session ID together with the session ID of a parent message in a single query.
+        Args:
+            db: Database session
+            session_id: ID of the chat session
+            parent_id: Optional ID of the parent message
+        Returns:
+            None if the session does not exist, else a row of (session ID, parent message session ID).
+            The parent message session ID is None if the parent message does not exist.
+        """
+        if parent_id is None:
+            # Without a parent only the session needs to exist, so the message join is skipped
+            query = select(ChatSession.id, null()).where(ChatSession.id == session_id)
+        else:
+            query = (
+                select(ChatSession.id, self.model.session_id)
+                .outerjoin(self.model, self.model.id == parent_id)
+                .where(ChatSession.id == session_id)
+            )
+        result = await db.execute(query)
+        return result.first()
+
     async def create(
         self,
         db: AsyncSession,
@@ -46,16 +94,17 @@ class CRUDMessage(CRUDBase[ChatMessage, MessageCreate, MessageUpdate]):
         Returns:
             Created ChatMessage
         """
-        message_data = obj_in.model_dump()
+        # Shallow field mapping of the already validated schema, without the recursive copy of model_dump
+        message_data = dict(obj_in)
         usage = message_data.pop("usage")
         attachments = message_data.pop("attachment_ids")
         db_obj = ChatMessage(
             **message_data,
             session_id=session_id,
-            input_tokens=usage["input_tokens"],
-            output_tokens=usage["output_tokens"],
-            input_cost=usage["input_cost"],
-            output_cost=usage["output_cost"],
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            input_cost=usage.input_cost,
+            output_cost=usage.output_cost,
         )
         db.add(db_obj)
         await db.flush()
@@ -124,9 +173,10 @@ class CRUDMessage(CRUDBase[ChatMessage, MessageCreate, MessageUpdate]):
         if exclude_message_id:
             conditions.append(self.model.id != exclude_message_id)
 
+        # Only role and content feed the context, so the selectin attachment loads are skipped
         query = (
             select(self.model)
-            .options(selectinload(self.model.attachments))
+            .options(noload(self.model.attachments), noload(self.model.direct_attachments))
             .where(*conditions)
             .order_by(self.model.created_at.desc())  # Get most recent first
             .limit(MAX_CONTEXT_MESSAGES)  # Limit to prevent memory issues
@@ -135,5 +185,28 @@ class CRUDMessage(CRUDBase[ChatMessage, MessageCreate, MessageUpdate]):
         result = await db.execute(query)
         return result.scalars().all()
 
+    async def bulk_update_status(self, db: AsyncSession, *, updates: list[tuple[UUID, UUID, MessageStatus]]) -> None:
+        """
+        Update the status of multiple messages in a single executemany UPDATE.
+        Messages that do not belong to the given session are left untouched.
+        Args:
+            db: Database session
+            updates: List of (session ID, message ID, status) entries
+        """
+        if not updates:
+            return
+        table = self.model.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("b_message_id"), table.c.session_id == bindparam("b_session_id"))
+            .values(status=bindparam("b_status"))
+        )
+        rows = [
+            {"b_session_id": session_id, "b_message_id": message_id, "b_status": status.value}
+            for session_id, message_id, status in updates
+        ]
+        await db.execute(statement, rows)
+        await db.commit()
+
 
 crud_message = CRUDMessage(model=ChatMessage)
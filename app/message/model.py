@@ -39,7 +39,7 @@ class ChatMessage(TimeStampedBase):
 
     # Attachments
     attachments: Mapped[list["MessageAttachment"]] = relationship(
-        back_populates="message", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="message", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin"
     )
 
     # Direct relationship to attachments through association
@@ -12,22 +12,26 @@ from app.message.exceptions import (
 )
 from app.message.model import ChatMessage
 from app.message.schema import MessageCreate, MessageUpdate
-from app.session.service import ChatSessionService
+from app.session.exceptions import SessionNotFoundException
+from app.session.schema import ChatUsage
 
 
 class ChatMessageService:
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
-        self.session_service = ChatSessionService(db=self.db)
 
     async def create_message(self, message_in: MessageCreate, session_id: UUID) -> ChatMessage:
-        session = await self.session_service.get_session(session_id=session_id)
-        # Verify parent message if provided
+        # Verify the session and the parent message (if provided) in a single query
+        row = await crud_message.get_session_with_parent(
+            db=self.db, session_id=session_id, parent_id=message_in.parent_id
+        )
+        if not row:
+            raise SessionNotFoundException(session_id=session_id)
         if message_in.parent_id:
-            parent = await crud_message.get(db=self.db, id=message_in.parent_id)
-            if not parent:
+            _, parent_session_id = row
+            if not parent_session_id:
                 raise ParentMessageNotFoundException(parent_id=message_in.parent_id)
-            if parent.session_id != session.id:
+            if parent_session_id != session_id:
                 raise InvalidParentMessageSessionException()
         # Create the message (which will also create the message attachments)
         return await crud_message.create(db=self.db, obj_in=message_in, session_id=session_id)
@@ -35,7 +39,8 @@ class ChatMessageService:
     async def list_messages(self, session_id: UUID, offset: int = 0, limit: int = 10) -> Sequence[ChatMessage]:
         messages = await crud_message.list_by_session(db=self.db, session_id=session_id, offset=offset, limit=limit)
         for message in messages:
-            message.usage = message.get_usage()
+            # Usage values come from typed ORM columns, so skip re-validation
+            message.usage = ChatUsage.model_construct(**message.get_usage())
         return messages
 
     async def get_session_context(
@@ -55,14 +60,17 @@ class ChatMessageService:
         )
 
     async def get_message(self, session_id: UUID, message_id: UUID) -> ChatMessage:
-        message = await crud_message.get_with_attachments(self.db, id=message_id)
-        session = await self.session_service.get_session(session_id=session_id)
+        # Verify the session and fetch the message in a single query
+        row = await crud_message.get_in_session(db=self.db, session_id=session_id, message_id=message_id)
+        if not row:
+            raise SessionNotFoundException(session_id=session_id)
+        _, message = row
         if not message:
             raise MessageNotFoundException(message_id=message_id)
 
-        if message.session_id != session.id:
+        if message.session_id != session_id:
             raise InvalidMessageSessionException()
-        message.usage = message.get_usage()
+        message.usage = ChatUsage.model_construct(**message.get_usage())
         return message
 
     async def update_message(self, session_id: UUID, message_id: UUID, message_in: MessageUpdate) -> ChatMessage | None:
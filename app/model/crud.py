@@ -1,6 +1,9 @@
-from sqlalchemy import select
+from itertools import groupby
+from uuid import UUID
+
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager
 
 from app.core.database.crud import CRUDBase
 from app.model.model import LLMModel
@@ -21,26 +24,43 @@ class CRUDModel(CRUDBase[LLMModel, ModelCreate, ModelUpdate]):
         Returns:
             Dictionary with provider names as keys and their models as values
         """
-        # Query that joins models with providers and gets all in one go
+        # Load each model's provider from the ordering join itself; joinedload would join the providers a second time
         query = (
             select(self.model)
-            .options(joinedload(LLMModel.provider))
             .join(LLMProvider, LLMModel.provider_id == LLMProvider.id)
+            .options(contains_eager(LLMModel.provider))
             .order_by(LLMProvider.name, LLMModel.name)
         )
 
         result = await db.scalars(query)
         models = result.all()
 
-        # Group models by provider name
-        grouped_models: dict[str, list[LLMModel]] = {}
-        for model in models:
-            provider_name = model.provider.name
-            if provider_name not in grouped_models:
-                grouped_models[provider_name] = []
-            grouped_models[provider_name].append(model)
+        # Rows are ordered by provider name, so each provider's models are already adjacent
+        return {
+            provider_name: list(provider_models)
+            for provider_name, provider_models in groupby(models, key=lambda model: model.provider.name)
+        }
 
-        return grouped_models
+    async def get_provider_with_model(
+        self, db: AsyncSession, provider_id: UUID, model_id: UUID
+    ) -> Row[tuple[UUID, UUID | None]] | None:
+        """
+        Get a provider ID together with the provider ID of a model in a single query.
+        Args:
+            db: Database session
+            provider_id: ID of the provider
+            model_id: ID of the model
+        Returns:
+            None if the provider does not exist, else a row of (provider ID, model provider ID).
+            The model provider ID is None if the model does not exist.
+        """
+        query = (
+            select(LLMProvider.id, self.model.provider_id)
+            .outerjoin(self.model, self.model.id == model_id)
+            .where(LLMProvider.id == provider_id)
+        )
+        result = await db.execute(query)
+        return result.first()
 
 
 crud_model = CRUDModel(model=LLMModel)
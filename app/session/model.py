@@ -41,7 +41,11 @@ class ChatSession(TimeStampedBase):
 
     # Relationships
     messages: Mapped[list[ChatMessage]] = relationship(
-        ChatMessage, back_populates="session", cascade="all, delete-orphan", order_by=ChatMessage.created_at
+        ChatMessage,
+        back_populates="session",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by=ChatMessage.created_at,
     )
 
     provider: Mapped[LLMProvider] = relationship(LLMProvider, back_populates="sessions")
@@ -3,8 +3,10 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.model.exceptions import InvalidModelProviderException
+from app.model.crud import crud_model
+from app.model.exceptions import InvalidModelProviderException, ModelNotFoundException
 from app.model.service import LLMModelService
+from app.provider.exceptions import ProviderNotFoundException
 from app.provider.service import LLMProviderService
 from app.session.crud import crud_session
 from app.session.exceptions import ActiveSessionNotFoundException, SessionNotFoundException
@@ -17,11 +19,16 @@ class ChatSessionService:
         self.db = db
 
     async def create_session(self, session_in: SessionCreate) -> ChatSession:
-        provider_service = LLMProviderService(db=self.db)
-        model_service = LLMModelService(db=self.db)
-        provider = await provider_service.get_provider(provider_id=session_in.provider_id)
-        model = await model_service.get_model(llm_model_id=session_in.llm_model_id)
-        if model.provider_id != provider.id:
+        # Verify the provider and the model (and that they belong together) in a single query
+        row = await crud_model.get_provider_with_model(
+            db=self.db, provider_id=session_in.provider_id, model_id=session_in.llm_model_id
+        )
+        if not row:
+            raise ProviderNotFoundException(provider_id=session_in.provider_id)
+        provider_id, model_provider_id = row
+        if not model_provider_id:
+            raise ModelNotFoundException(model_id=session_in.llm_model_id)
+        if model_provider_id != provider_id:
             raise InvalidModelProviderException()
         return await crud_session.create(db=self.db, obj_in=session_in)
 